@@ -5,12 +5,12 @@ save and load their member variables to and from dictionaries.
 """
 import inspect
 import json
+import sys
+import weakref
 from abc import ABC, abstractmethod
-from enum import Enum
+from enum import Enum, EnumMeta
 from pathlib import Path
 
-import numpy as np
-
 
 class Parameterized(object):
     """
@@ -22,7 +22,13 @@ class Parameterized(object):
     DO NOT INSTANTIATE
     """
 
-    excluded_params = []  # Attribute names that should not be considered params
+    excluded_params = frozenset()  # Attribute names that should not be considered params
+
+    def __init_subclass__(cls, **kwargs):
+        """Stores the excluded_params defined by a subclass as a frozenset for fast lookups"""
+        super().__init_subclass__(**kwargs)
+        if "excluded_params" in cls.__dict__:
+            cls.excluded_params = frozenset(cls.excluded_params)
 
     def update_from_params(self, params: dict):
         """
@@ -36,9 +42,10 @@ class Parameterized(object):
         Returns dict of this object's attributes,
         excluding any attributes in the excluded_params list
         """
-        params = self.__dict__.copy()
-        [params.pop(key) for key in self.excluded_params if key in params]
-        return params
+        excluded_params = self.excluded_params
+        if not excluded_params:
+            return self.__dict__.copy()
+        return {key: value for key, value in self.__dict__.items() if key not in excluded_params}
 
     @classmethod
     def from_params(cls, params: dict):
@@ -57,7 +64,20 @@ class Parameterized(object):
         """
         The toString method that prints this object's params using json indented formatting
         """
-        return json.dumps(self.get_params(), indent=2, default=default_json_serializer)
+        return _str_encoder.encode(self.get_params())
+
+
+# Caches of the subclass lookups of each ParameterizedInterface class.
+# Classes are only referenced weakly so the caches don't keep unused subclasses alive.
+# These are cleared whenever a subclass is defined or a cached one is garbage collected.
+_parameterized_subclasses_cache = weakref.WeakKeyDictionary()
+_subclass_type_mapping_cache = weakref.WeakKeyDictionary()
+
+
+def _clear_subclass_caches(_ref=None):
+    """Clears the cached subclass lookups (also used as a weakref callback)"""
+    _parameterized_subclasses_cache.clear()
+    _subclass_type_mapping_cache.clear()
 
 
 class ParameterizedInterface(Parameterized, ABC):
@@ -74,11 +94,16 @@ class ParameterizedInterface(Parameterized, ABC):
     excluded_subclasses should be defined in the superclass and specify the names
     of child classes to ignore (aka treat as abstract)
 
+    The valid subclasses of each interface are computed once and cached until
+    another subclass is defined (or a cached one is garbage collected),
+    so excluded_subclasses and the subclasses' _type should not be changed
+    after the class hierarchy has been used.
+
     DO NOT INSTANTIATE
     """
 
-    excluded_subclasses = []
-    excluded_params = []
+    excluded_subclasses = frozenset()
+    excluded_params = frozenset()
 
     @property
     @abstractmethod
@@ -92,35 +117,38 @@ class ParameterizedInterface(Parameterized, ABC):
         """Should just be overridden  as a class attribute; not as a function"""
         pass
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Stores the excluded_subclasses defined by a subclass as a frozenset
+        and invalidates the cached subclass lookups whenever a new subclass is defined
+        """
+        super().__init_subclass__(**kwargs)
+        if "excluded_subclasses" in cls.__dict__:
+            cls.excluded_subclasses = frozenset(cls.excluded_subclasses)
+        _clear_subclass_caches()
+
     def get_params(self) -> dict:
         """ Adds the type to the params"""
         params = super().get_params()
-        params.update({"type": self._type})
+        params["type"] = self._type
         return params
 
     @classmethod
     def from_params(cls, params: dict):
         """Create the instance given the params, which should contain the instance's "type" """
-        if not hasattr(cls, "_type_enum"):
+        type_enum = getattr(cls, "_type_enum", None)
+        if not isinstance(type_enum, EnumMeta):  # still the abstract property
             raise Exception("_type_enum attribute does not exist on the given class!")
 
         t = params["type"]  # the enum type
 
         # in case we only have the name of the enum
         if not isinstance(t, Enum):
-            t = cls._type_enum[t]
-
-        # get sub classes via inspection
-        subclasses = cls.all_parameterized_subclasses()
+            t = type_enum[t]
 
         # find specific sub class
-        found = False
-        for c in subclasses:
-            if c._type == t:
-                found = True
-                break
-
-        if not found:
+        c = cls._subclass_for_type(t)
+        if c is None:
             raise Exception(f"Unable to create subclass of the given type: {t}")
 
         result = c()
@@ -131,21 +159,30 @@ class ParameterizedInterface(Parameterized, ABC):
     @classmethod
     def all_parameterized_subclasses(cls):
         """Gets all the valid parameterized subclasses of this parameterized superclass"""
-        if not hasattr(cls, "_type_enum"):
+        try:
+            return {ref() for ref in _parameterized_subclasses_cache[cls]}
+        except KeyError:
+            pass
+
+        type_enum = getattr(cls, "_type_enum", None)
+        if not isinstance(type_enum, EnumMeta):  # still the abstract property
             raise Exception(
                 "Attempted to retrieve parameterized subclasses of a non-parameterized superclass!"
             )
 
         subs = all_subclasses(cls)
 
-        return {
+        result = {
             s
             for s in subs
-            if hasattr(s, "_type")
-            and type(s._type) == cls._type_enum
+            if isinstance(getattr(s, "_type", None), type_enum)
             and not inspect.isabstract(s)
             and s.__name__ not in cls.excluded_subclasses
         }
+        _parameterized_subclasses_cache[cls] = tuple(
+            weakref.ref(s, _clear_subclass_caches) for s in result
+        )
+        return result
 
     @classmethod
     def subclass_type_mapping(cls):
@@ -159,6 +196,29 @@ class ParameterizedInterface(Parameterized, ABC):
 
         return {s._type: s for s in subclasses}
 
+    @classmethod
+    def _subclass_for_type(cls, t):
+        """
+        Gets the subclass of the given type from subclass_type_mapping(), or None if there isn't one.
+
+        The default mapping is cached with weak references to the subclasses.
+        An overridden mapping may contain any values, so it is used as-is without caching.
+        """
+        default_mapping = ParameterizedInterface.subclass_type_mapping.__func__
+        if getattr(cls.subclass_type_mapping, "__func__", None) is not default_mapping:
+            return cls.subclass_type_mapping().get(t)
+
+        try:
+            mapping = _subclass_type_mapping_cache[cls]
+        except KeyError:
+            mapping = _subclass_type_mapping_cache[cls] = {
+                type_: weakref.ref(s, _clear_subclass_caches)
+                for type_, s in cls.subclass_type_mapping().items()
+            }
+
+        ref = mapping.get(t)
+        return ref() if ref is not None else None
+
 
 # =========================================================
 # Helpful Utilities
@@ -175,32 +235,77 @@ def update_attr_from_dict(obj, params, excluded_keys=None):
     """
 
     if excluded_keys is None:
-        excluded_keys = []
-    for key in obj.__dict__:  # loop object attributes
+        excluded_keys = ()
+    obj_dict = obj.__dict__
+    if not hasattr(params, "items"):  # params only supports "in" and []
+        for key in obj_dict:  # loop object attributes
+            if key in params and key not in excluded_keys:
+                obj_dict[key] = params[key]
+        return
+
+    for key, value in params.items():  # loop given params
         if (
-            key in params and key not in excluded_keys
-        ):  # update if the key is in the params and is not excluded
-            obj.__dict__[key] = params[key]
+            key in obj_dict and key not in excluded_keys
+        ):  # update if the key is an existing attribute and is not excluded
+            obj_dict[key] = value
+
+
+# Ordered (type, serializer) pairs used by default_json_serializer for less common types
+_JSON_SERIALIZERS = ((Path, str),)
+
+# Cache of concrete type -> serializer; weak so it doesn't keep serialized types alive
+_json_serializer_cache = weakref.WeakKeyDictionary()
+
+
+def _find_json_serializer(type_):
+    """Returns the first serializer in _JSON_SERIALIZERS that handles the given type"""
+    for base, serializer in _JSON_SERIALIZERS:
+        if issubclass(type_, base):
+            return serializer
+
+    # numpy is not imported here; an ndarray can only exist if numpy was imported elsewhere
+    np = sys.modules.get("numpy")
+    if np is not None and issubclass(type_, np.ndarray):
+        return np.ndarray.tolist
+    return None
 
 
 def default_json_serializer(obj):
     """
     This can be used as the 'default' parameter in json.dump
     to allow the serialization of parameterized or enum objects
+
+    Parameterized and Enum objects are checked directly since they are the most common.
+    The serializer for any other type is resolved once and cached for that type.
     """
     if isinstance(obj, Parameterized):
         return obj.get_params()
-    elif isinstance(obj, Enum):
+    if isinstance(obj, Enum):
         return obj.name
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, Path):
-        return str(obj)
-    else:
-        raise TypeError(f"Attempted to parse unrecognized type {type(obj)}")
+
+    type_ = type(obj)
+    try:
+        serializer = _json_serializer_cache[type_]
+    except KeyError:
+        serializer = _find_json_serializer(type_)
+        if serializer is None:
+            raise TypeError(f"Attempted to parse unrecognized type {type_}") from None
+        _json_serializer_cache[type_] = serializer
+
+    return serializer(obj)
+
+
+# Encoder used by Parameterized.__str__, built once instead of on every json.dumps call
+_str_encoder = json.JSONEncoder(indent=2, default=default_json_serializer)
 
 
 def all_subclasses(cls):
     """Returns a set of all the subclasses of the given class"""
-    subs = cls.__subclasses__()
-    return set(subs).union([s for c in subs for s in all_subclasses(c)])
+    result = set()
+    stack = cls.__subclasses__()
+    while stack:
+        c = stack.pop()
+        if c not in result:  # classes can be reached more than once via multiple inheritance
+            result.add(c)
+            stack.extend(c.__subclasses__())
+    return result
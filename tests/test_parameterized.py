@@ -1,6 +1,15 @@
+import gc
+import json
+import subprocess
+import sys
+import weakref
+from enum import Enum
+from pathlib import Path
+
+import numpy as np
 import pytest
 
-from parameterized import Parameterized
+from parameterized import Parameterized, default_json_serializer, update_attr_from_dict
 
 
 @pytest.fixture
@@ -49,6 +58,30 @@ class TestParameterized:
 
         assert str(obj) == '{\n  "i": 5,\n  "b": false,\n  "s": "Hello"\n}'
 
+    def test_default_json_serializer(self, example_class, example_params):
+        class Color(Enum):
+            RED = 1
+
+        obj = example_class()
+        data = {
+            "obj": obj,
+            "color": Color.RED,
+            "array": np.array([[1, 2], [3, 4]]),
+            "path": Path("a/b"),
+        }
+
+        # serialize twice to exercise the cached lookups as well
+        for _ in range(2):
+            assert json.loads(json.dumps(data, default=default_json_serializer)) == {
+                "obj": example_params,
+                "color": "RED",
+                "array": [[1, 2], [3, 4]],
+                "path": str(Path("a/b")),
+            }
+
+        with pytest.raises(TypeError):
+            default_json_serializer(object())
+
     def test_excluded_params(self, example_class, example_params):
         example_class.excluded_params = ["i"]
         example_params.pop("i")
@@ -61,3 +94,56 @@ class TestParameterized:
         obj.update_from_params({"i": 100, "no": False})
         assert obj.i == 5
         assert not hasattr(obj, "no")
+
+    def test_excluded_params_frozenset(self):
+        class Test(Parameterized):
+            excluded_params = ["i"]
+
+            def __init__(self):
+                self.i = 5
+                self.s = "Hello"
+
+        assert Test.excluded_params == frozenset({"i"})
+        assert Test().get_params() == {"s": "Hello"}
+
+    def test_default_json_serializer_does_not_keep_types_alive(self):
+        def dump_local_class():
+            class Local(Parameterized):
+                def __init__(self):
+                    self.i = 1
+
+            class Unknown:
+                pass
+
+            json.dumps(Local(), default=default_json_serializer)
+            with pytest.raises(TypeError):
+                default_json_serializer(Unknown())
+            return weakref.ref(Local), weakref.ref(Unknown)
+
+        refs = dump_local_class()
+        gc.collect()
+        assert all(ref() is None for ref in refs)
+
+    def test_import_does_not_import_numpy(self):
+        # run in a fresh interpreter since this test module itself imports numpy
+        code = "import sys, parameterized; assert 'numpy' not in sys.modules"
+        subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent, check=True)
+
+    def test_update_attr_from_dict_mapping_like(self, example_class):
+        class MappingLike:
+            """Only supports "in" and [] like a minimal mapping"""
+
+            def __init__(self, data):
+                self.data = data
+
+            def __contains__(self, key):
+                return key in self.data
+
+            def __getitem__(self, key):
+                return self.data[key]
+
+        obj = example_class()
+        update_attr_from_dict(obj, MappingLike({"i": 0, "s": "Goodbye", "no": 1}), excluded_keys=["s"])
+
+        assert obj.get_params() == {"i": 0, "b": False, "s": "Hello"}
+        assert not hasattr(obj, "no")
@@ -1,3 +1,4 @@
+import gc
 import json
 from enum import Enum
 
@@ -53,3 +54,110 @@ class TestParameterizedInterface:
 
         # this shouldn't error
         GoodChild()
+
+        # BadParent never defined its _type_enum
+        with pytest.raises(Exception, match="non-parameterized superclass"):
+            BadParent.all_parameterized_subclasses()
+
+        with pytest.raises(Exception, match="_type_enum attribute does not exist"):
+            BadParent.from_params({"type": "ONE"})
+
+    def test_subclass_cache(self, example_enum):
+        class Parent(ParameterizedInterface):
+            _type_enum = example_enum
+
+        class One(Parent):
+            _type = example_enum.ONE
+
+        assert Parent.all_parameterized_subclasses() == {One}
+        assert Parent.subclass_type_mapping() == {example_enum.ONE: One}
+
+        # defining a new subclass must invalidate the cached lookups
+        class Two(Parent):
+            _type = example_enum.TWO
+
+        assert Parent.all_parameterized_subclasses() == {One, Two}
+        assert Parent.subclass_type_mapping() == {example_enum.ONE: One, example_enum.TWO: Two}
+
+        # returned collections are copies of the cached values
+        Parent.all_parameterized_subclasses().clear()
+        assert Parent.all_parameterized_subclasses() == {One, Two}
+
+    def test_from_params(self, example_enum):
+        class Parent(ParameterizedInterface):
+            _type_enum = example_enum
+
+            def __init__(self):
+                self.x = 0
+
+        class One(Parent):
+            _type = example_enum.ONE
+
+        class Two(Parent):
+            _type = example_enum.TWO
+
+        obj = Parent.from_params({"type": "TWO", "x": 5})
+        assert type(obj) is Two
+        assert obj.x == 5
+        assert obj.get_params() == {"x": 5, "type": example_enum.TWO}
+
+        obj = Parent.from_params({"type": example_enum.ONE, "x": 1})
+        assert type(obj) is One
+
+        with pytest.raises(Exception, match="Unable to create subclass"):
+            Parent.from_params({"type": "THREE"})
+
+    def test_excluded_subclasses(self, example_enum):
+        class Parent(ParameterizedInterface):
+            _type_enum = example_enum
+            excluded_subclasses = ["Excluded"]
+
+        class Included(Parent):
+            _type = example_enum.ONE
+
+        class Excluded(Parent):
+            _type = example_enum.TWO
+
+        assert Parent.excluded_subclasses == frozenset({"Excluded"})
+        assert Parent.all_parameterized_subclasses() == {Included}
+
+    def test_subclass_cache_does_not_keep_subclasses_alive(self, example_enum):
+        class Parent(ParameterizedInterface):
+            _type_enum = example_enum
+
+        def define_child():
+            class Child(Parent):
+                _type = example_enum.ONE
+
+            assert Parent.all_parameterized_subclasses() == {Child}
+            assert type(Parent.from_params({"type": "ONE"})) is Child
+
+        define_child()
+        gc.collect()
+
+        assert Parent.all_parameterized_subclasses() == set()
+        with pytest.raises(Exception, match="Unable to create subclass"):
+            Parent.from_params({"type": "ONE"})
+
+    def test_overridden_subclass_type_mapping(self, example_enum):
+        class Parent(ParameterizedInterface):
+            _type_enum = example_enum
+
+            def __init__(self):
+                self.x = 0
+
+            @classmethod
+            def subclass_type_mapping(cls):
+                # custom constructors that can't be weakly referenced by a cache
+                return {example_enum.ONE: lambda: One()}
+
+        class One(Parent):
+            _type = example_enum.ONE
+
+        for _ in range(2):
+            obj = Parent.from_params({"type": "ONE", "x": 3})
+            assert type(obj) is One
+            assert obj.x == 3
+
+        with pytest.raises(Exception, match="Unable to create subclass"):
+            Parent.from_params({"type": "TWO"})